@@ -0,0 +1,15 @@
+"""Shared agent-construction helpers."""
+
+from agents.factory import (
+    get_hf_model,
+    get_image_agent,
+    get_image_generation_tool,
+    get_search_tool,
+)
+
+__all__ = [
+    "get_hf_model",
+    "get_image_agent",
+    "get_image_generation_tool",
+    "get_search_tool",
+]
@@ -0,0 +1,39 @@
+"""
+Shared factories for agent construction.
+
+Each demo used to build its own HfApiModel and re-run
+load_tool("m-ric/text-to-image", trust_remote_code=True) -- a remote Hub
+fetch plus a dynamic import every time. Memoizing the constructors here
+means any number of entry points in one process share a single tool, model
+and agent instance.
+"""
+
+import functools
+from typing import Optional
+
+from smolagents import CodeAgent, DuckDuckGoSearchTool, HfApiModel, load_tool
+
+DEFAULT_MODEL_ID = "Qwen/Qwen2.5-Coder-32B-Instruct"
+
+@functools.lru_cache(maxsize=None)
+def get_image_generation_tool():
+    """Fetch the text-to-image Hub tool once per process."""
+    return load_tool("m-ric/text-to-image", trust_remote_code=True)
+
+@functools.lru_cache(maxsize=None)
+def get_search_tool() -> DuckDuckGoSearchTool:
+    """Return the shared search tool so its HTTP client is reused per process."""
+    return DuckDuckGoSearchTool()
+
+@functools.lru_cache(maxsize=None)
+def get_hf_model(model_id: Optional[str] = None) -> HfApiModel:
+    """Return the shared HfApiModel for model_id (smolagents' default if None)."""
+    return HfApiModel(model_id=model_id) if model_id else HfApiModel()
+
+@functools.lru_cache(maxsize=None)
+def get_image_agent(model_id: str = DEFAULT_MODEL_ID) -> CodeAgent:
+    """Return the shared CodeAgent wired with the image generation tool."""
+    return CodeAgent(
+        tools=[get_image_generation_tool()],
+        model=get_hf_model(model_id),
+    )
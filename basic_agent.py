@@ -1,13 +1,21 @@
-from smolagents import CodeAgent, DuckDuckGoSearchTool, HfApiModel
+import os
+import sys
 from pprint import pprint
 
-pprint(HfApiModel().model_id)
+from smolagents import CodeAgent, DuckDuckGoSearchTool
 
+# Make the repo root importable when running a subdirectory copy
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-model = HfApiModel()
+from agents.factory import get_hf_model
+
+pprint(get_hf_model().model_id)
+
+
+model = get_hf_model()
 agent = CodeAgent(tools=[DuckDuckGoSearchTool()], model=model)
 
 
 agent.run("How long does it take to get to the moon with a Sturn 5 rocket?")
 
-agent.run("What's the code to generate fibonacci numbers?")
\ No newline at end of file
+agent.run("What's the code to generate fibonacci numbers?")
@@ -4,7 +4,15 @@ import os
 from typing import Dict, List, Optional, Any
 
 from colorama import Fore, Style, init
-from helium import *
+from helium import (
+    start_chrome,
+    go_to,
+    click,
+    write,
+    find_all,
+    get_driver,
+    kill_browser,
+)
 from PIL import Image
 from smolagents import CodeAgent, HfApiModel
 from smolagents.agents import ActionStep
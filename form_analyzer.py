@@ -8,11 +8,14 @@ This tool:
 4. Can be used with Helium automation agents
 """
 
+import io
 import os
 import json
 import logging
+import operator
 import traceback
-from time import sleep
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from string import Template
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 
@@ -36,7 +39,196 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+# JSON encoding goes through orjson (a Rust extension, several times faster
+# than the stdlib on nested dicts) when it is installed, falling back to the
+# stdlib encoder otherwise. Both paths return UTF-8 bytes without escaping
+# non-ASCII characters.
+try:
+    import orjson
+
+    def _dumps(obj: Any, indent: Optional[int] = None) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:
+    def _dumps(obj: Any, indent: Optional[int] = None) -> bytes:
+        return json.dumps(obj, indent=indent, ensure_ascii=False).encode("utf-8")
+
+# Selector strings used on every analysis pass, built once at import so the
+# hot paths don't re-allocate them per call
+_FORM_BUTTON_SELECTOR = "button.px-4.py-2.rounded"
+_FORM_CONTAINER_SELECTOR = "div.bg-white.p-6.rounded.shadow-md"
+_SUBMIT_BUTTON_SELECTOR = "button[type='submit']"
+_FIELD_ELEMENTS_SELECTOR = "input, textarea, select"
+
+# JavaScript payload that walks a form container in-page and returns every
+# field's attributes plus the submit button label in one WebDriver
+# round-trip. Reading each attribute via get_attribute() costs a separate
+# JSON-wire call (~1-3 ms each), so on a form with N fields the per-element
+# path pays O(N * attrs) round-trips; this pays exactly one.
+_FORM_SNAPSHOT_JS = """
+const form = arguments[0];
+const fields = [];
+const labelMap = {};
+document.querySelectorAll('label[for]').forEach(function (l) {
+    labelMap[l.getAttribute('for')] = l.innerText.trim();
+});
+form.querySelectorAll('input, textarea, select').forEach(function (el) {
+    let labelText = el.id ? (labelMap[el.id] || '') : '';
+    if ((el.type === 'checkbox' || el.type === 'radio') && !labelText) {
+        const parent = el.closest('label');
+        if (parent) {
+            const span = parent.querySelector('span');
+            labelText = (span ? span.innerText : parent.innerText).trim();
+        }
+    }
+    fields.push({
+        tag: el.tagName.toLowerCase(),
+        type: el.type || 'text',
+        id: el.id || '',
+        name: el.name || '',
+        placeholder: el.placeholder || '',
+        required: el.required || false,
+        value: el.value || '',
+        label: labelText,
+        options: el.tagName === 'SELECT'
+            ? Array.from(el.options).map(function (o) { return o.text; }).filter(Boolean)
+            : []
+    });
+});
+const submit = form.querySelector("button[type='submit'], input[type='submit']");
+return {
+    fields: fields,
+    submit: submit ? (submit.innerText || submit.value || '').trim() : null
+};
+"""
+
+# Output keys and matching attribute reader for FormField.to_dict, built
+# once so serialization is a zip over precomputed tuples rather than a dict
+# literal reconstructed per call
+_FORM_FIELD_KEYS = ("name", "id", "type", "label", "required", "options", "placeholder")
+_FORM_FIELD_ATTRS = operator.attrgetter(
+    "name", "field_id", "field_type", "label", "required", "options", "placeholder"
+)
+
+# JavaScript emitted into every generated script. Filling a form field by
+# field costs one WebDriver round-trip per write/click/select; this payload
+# sets all values, dispatches input/change events so framework bindings see
+# the updates, toggles checkboxes/radios via click, and picks select options
+# by visible text -- all in a single execute_script call.
+_FILL_FORM_JS = """\
+const data = arguments[0];
+const find = function (name) {
+    return document.querySelector('[name="' + name + '"], #' + name);
+};
+for (const [name, value] of Object.entries(data.values || {})) {
+    const el = find(name);
+    if (!el) continue;
+    el.value = value;
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+}
+for (const [name, value] of Object.entries(data.checks || {})) {
+    const el = value
+        ? document.querySelector('[name="' + name + '"][value="' + value + '"]')
+        : find(name);
+    if (el && !el.checked) el.click();
+}
+for (const [name, optionText] of Object.entries(data.selects || {})) {
+    const el = document.querySelector('select[name="' + name + '"], select#' + name);
+    if (!el) continue;
+    for (const opt of el.options) {
+        if (opt.text === optionText) { el.value = opt.value; break; }
+    }
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+}"""
+
+# Field types whose fill value goes into the 'values' section of the
+# batched payload
+_TEXT_FIELD_TYPES = frozenset({"text", "email", "password", "tel", "date", "time"})
+
+def _build_fill_payload(fields: List[Dict[str, Any]]) -> Dict[str, Dict[str, str]]:
+    """Group analyzed fields into the values/checks/selects payload that
+    _FILL_FORM_JS consumes; empty sections are omitted."""
+    values: Dict[str, str] = {}
+    checks: Dict[str, str] = {}
+    selects: Dict[str, str] = {}
+    for field in fields:
+        field_type = field["type"]
+        if field_type in _TEXT_FIELD_TYPES:
+            values[field["name"]] = f"example_{field['name']}"
+        elif field_type == "textarea":
+            values[field["name"]] = f"Sample text for {field['name']}"
+        elif field_type == "checkbox":
+            options = field["options"]
+            # A concrete value picks one box out of a group; plain 'on'
+            # checkboxes match by name alone
+            checks[field["name"]] = options[0] if options and options[0] != "on" else ""
+        elif field_type == "radio":
+            if field["options"]:
+                checks[field["name"]] = field["options"][0]
+        elif field_type == "select":
+            if field["options"] and len(field["options"]) > 1:
+                # Select the second option (index 1) to avoid the placeholder
+                selects[field["name"]] = field["options"][1]
+    payload: Dict[str, Dict[str, str]] = {}
+    if values:
+        payload["values"] = values
+    if checks:
+        payload["checks"] = checks
+    if selects:
+        payload["selects"] = selects
+    return payload
+
+# Script blocks for generate_helium_script, parsed once at import and
+# written into a single StringIO buffer per generated script
+_SCRIPT_HEADER_TMPL = Template("""\
+# Auto-generated Helium script for form interaction
+from helium import (
+    Button,
+    Config,
+    S,
+    TextField,
+    click,
+    get_driver,
+    go_to,
+    kill_browser,
+    wait_until,
+)
+
+# Short-poll field lookups instead of the default 10s implicit wait
+Config.implicit_wait_secs = 1
+
+# Sets every field of a form in one WebDriver round-trip
+FILL_FORM_JS = \"\"\"\\
+$fill_js\"\"\"
+
+# Navigate to the target page
+go_to('$url')
+wait_until(S('body').exists)  # Wait for page to load
+
+""")
+
+_FORM_OPEN_TMPL = Template("""\
+def fill_${func_name}_form():
+    # Click the $button_label button to show the form
+    click('$button_label')
+    wait_until($ready_condition, timeout_secs=5)  # Wait for form to appear
+
+""")
+
+_FORM_SUBMIT_TMPL = Template("""
+    # Submit the form
+    click('$submit_button')
+    wait_until(lambda: not Button('$submit_button').exists(), timeout_secs=5)
+    # Handle any confirmation dialogs here if needed
+""")
+
+_MAIN_CALL_TMPL = Template("""\
+    fill_${func_name}_form()
+    # You can add verification code here to check if form submission was successful
+
+""")
+
+@dataclass(slots=True)
 class FormField:
     """Represents a field in a form."""
     name: str
@@ -46,27 +238,34 @@ class FormField:
     required: bool = False
     options: List[str] = field(default_factory=list)
     placeholder: str = ""
-    
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert field to dictionary."""
-        return {
-            "name": self.name,
-            "id": self.field_id,
-            "type": self.field_type,
-            "label": self.label,
-            "required": self.required,
-            "options": self.options,
-            "placeholder": self.placeholder
-        }
+        return dict(zip(_FORM_FIELD_KEYS, _FORM_FIELD_ATTRS(self)))
 
-@dataclass
+@dataclass(slots=True)
 class Form:
     """Represents a form with its fields."""
     name: str
     form_id: str
     fields: List[FormField] = field(default_factory=list)
     submit_button: Optional[str] = None
-    
+    # Transient (name, type) -> FormField index so checkbox/radio group
+    # lookups during extraction are O(1) instead of scanning all fields;
+    # not part of the serialized form
+    _by_name_type: Dict[Tuple[str, str], FormField] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def add_field(self, new_field: FormField) -> None:
+        """Add a field and index it for group deduplication."""
+        self.fields.append(new_field)
+        self._by_name_type[(new_field.name, new_field.field_type)] = new_field
+
+    def find_field(self, name: str, field_type: str) -> Optional[FormField]:
+        """Look up a field by (name, type) in O(1)."""
+        return self._by_name_type.get((name, field_type))
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert form to dictionary."""
         return {
@@ -79,17 +278,45 @@ class Form:
 class FormAnalyzer:
     """Analyzes forms on a web page and extracts structured information."""
     
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, max_workers: int = 1,
+                 close_on_finish: bool = True):
         """Initialize the FormAnalyzer.
-        
+
         Args:
             headless: Whether to run the browser in headless mode
+            max_workers: Number of headless browsers used to analyze forms
+                concurrently; 1 keeps the original serial behavior
+            close_on_finish: Whether analyze_page closes the browser when it
+                returns; set False (or use the context manager) to keep one
+                browser warm across multiple pages
         """
         self.driver = None
         self.headless = headless
+        self.max_workers = max_workers
+        self.close_on_finish = close_on_finish
         self.screenshots_dir = "form_screenshots"
         os.makedirs(self.screenshots_dir, exist_ok=True)
-        
+        # Screenshot bytes are written to disk off the WebDriver hot path
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        self._pending_writes: List[Future] = []
+
+    def __enter__(self) -> "FormAnalyzer":
+        """Enter a session that reuses one browser across analyze_page calls."""
+        self.close_on_finish = False
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        """Tear down the shared browser at the end of the session."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the browser if it is running."""
+        self._flush_screenshot_writes()
+        if self.driver:
+            logger.info("Closing browser")
+            helium.kill_browser()
+            self.driver = None
+
     def initialize_browser(self) -> bool:
         """Initialize the browser."""
         try:
@@ -127,8 +354,10 @@ class FormAnalyzer:
         try:
             logger.info(f"Navigating to {url}")
             helium.go_to(url)
-            # Wait for page to load
-            sleep(2)
+            # Proceed as soon as the document settles instead of a fixed sleep
+            WebDriverWait(self.driver, 10).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
             return True
         except Exception as e:
             logger.error(f"Error navigating to {url}: {e}")
@@ -150,13 +379,39 @@ class FormAnalyzer:
             
         try:
             file_path = os.path.join(self.screenshots_dir, f"{name}.png")
-            self.driver.save_screenshot(file_path)
+            # Grab the raw PNG bytes and hand the disk write to the I/O
+            # pool so the next WebDriver call isn't blocked on file I/O
+            png_bytes = self.driver.get_screenshot_as_png()
+            self._submit_screenshot_write(file_path, png_bytes)
             logger.info(f"Screenshot saved to {file_path}")
             return file_path
         except Exception as e:
             logger.error(f"Error taking screenshot: {e}")
             traceback.print_exc()
             return None
+
+    def _submit_screenshot_write(self, file_path: str, png_bytes: bytes) -> None:
+        """Queue a screenshot write on the background I/O pool.
+
+        Args:
+            file_path: Destination path for the screenshot
+            png_bytes: Raw PNG bytes to write
+        """
+        self._pending_writes.append(
+            self._io_pool.submit(self._write_screenshot, file_path, png_bytes)
+        )
+
+    @staticmethod
+    def _write_screenshot(file_path: str, png_bytes: bytes) -> None:
+        """Write screenshot bytes to disk (runs on the I/O pool)."""
+        with open(file_path, "wb") as f:
+            f.write(png_bytes)
+
+    def _flush_screenshot_writes(self) -> None:
+        """Block until all queued screenshot writes have finished."""
+        if self._pending_writes:
+            wait(self._pending_writes)
+            self._pending_writes.clear()
     
     def identify_forms(self) -> List[Form]:
         """Identify all forms on the page based on the test-forms.tsx structure.
@@ -180,11 +435,16 @@ class FormAnalyzer:
             )
             
             # Find the form selector buttons to identify available forms
-            form_buttons = self.driver.find_elements(By.XPATH, "//button[contains(@class, 'px-4 py-2 rounded')]")
+            form_buttons = self.driver.find_elements(By.CSS_SELECTOR, _FORM_BUTTON_SELECTOR)
             form_types = [btn.text for btn in form_buttons]
             
             logger.info(f"Found form types: {form_types}")
-            
+
+            # Independent forms can be analyzed concurrently, each in its
+            # own headless browser, overlapping the per-form waits
+            if self.max_workers > 1 and len(form_types) > 1:
+                return self._identify_forms_parallel(form_types)
+
             # Process each form by clicking its button
             for i, form_type in enumerate(form_types):
                 form_name = form_type.strip()
@@ -192,27 +452,31 @@ class FormAnalyzer:
                 # Click the form button to display it
                 logger.info(f"Clicking on {form_name} button")
                 form_buttons[i].click()
-                sleep(1)  # Give time for the form to appear
-                
+
+                # Wait for the revealed form container instead of a fixed sleep
+                form_container = WebDriverWait(self.driver, 10).until(
+                    EC.visibility_of_element_located(
+                        (By.CSS_SELECTOR, _FORM_CONTAINER_SELECTOR)
+                    )
+                )
+
                 # Take a screenshot of this form
                 self.take_screenshot(f"{form_name.lower().replace(' ', '_')}_form")
                 
-                # Find the form container
-                form_container = self.driver.find_element(By.XPATH, "//div[contains(@class, 'bg-white p-6 rounded shadow-md')]")
-                
                 # Extract form ID (using a placeholder since the React components don't have explicit IDs)
                 form_id = form_name.lower().replace(" ", "_")
                 
                 # Create a Form object
                 current_form = Form(name=form_name, form_id=form_id)
                 
-                # Find form fields in the current form
+                # Find form fields (and the submit button) in one snapshot
                 self._extract_form_fields(form_container, current_form)
-                
-                # Find submit button
-                submit_buttons = form_container.find_elements(By.XPATH, ".//button[@type='submit']")
-                if submit_buttons:
-                    current_form.submit_button = submit_buttons[0].text
+
+                # Only the per-element fallback leaves the submit unset
+                if current_form.submit_button is None:
+                    submit_buttons = form_container.find_elements(By.CSS_SELECTOR, _SUBMIT_BUTTON_SELECTOR)
+                    if submit_buttons:
+                        current_form.submit_button = submit_buttons[0].text
                 
                 forms.append(current_form)
             
@@ -223,80 +487,255 @@ class FormAnalyzer:
             traceback.print_exc()
             return []
     
-    def _extract_form_fields(self, form_element: webdriver.remote.webelement.WebElement, form: Form) -> None:
+    def _identify_forms_parallel(self, form_types: List[str]) -> List[Form]:
+        """Analyze each form concurrently in its own headless browser.
+
+        Args:
+            form_types: The form selector button labels found on the page
+
+        Returns:
+            List[Form]: The analyzed forms, in the original button order
+        """
+        url = self.driver.current_url
+        workers = min(len(form_types), self.max_workers)
+        logger.info(f"Analyzing {len(form_types)} forms with {workers} workers")
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._analyze_single_form, url, form_type.strip())
+                for form_type in form_types
+            ]
+            return [form for form in (f.result() for f in futures) if form is not None]
+
+    def _analyze_single_form(self, url: str, form_name: str) -> Optional[Form]:
+        """Analyze one form in a dedicated headless browser.
+
+        Args:
+            url: The page URL to load
+            form_name: The label of the form selector button to click
+
+        Returns:
+            Optional[Form]: The analyzed form, or None on failure
+        """
+        driver = None
+        try:
+            chrome_options = webdriver.ChromeOptions()
+            chrome_options.add_argument("--window-size=1920,1080")
+            chrome_options.add_argument("--headless")
+            driver = webdriver.Chrome(options=chrome_options)
+
+            driver.get(url)
+            WebDriverWait(driver, 10).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+
+            # Click the button matching this form
+            button = next(
+                (b for b in driver.find_elements(By.CSS_SELECTOR, _FORM_BUTTON_SELECTOR)
+                 if b.text.strip() == form_name),
+                None
+            )
+            if button is None:
+                logger.warning(f"Form button '{form_name}' not found by worker")
+                return None
+            button.click()
+
+            form_container = WebDriverWait(driver, 10).until(
+                EC.visibility_of_element_located(
+                    (By.CSS_SELECTOR, _FORM_CONTAINER_SELECTOR)
+                )
+            )
+
+            # Screenshot from the worker's own browser
+            screenshot_path = os.path.join(
+                self.screenshots_dir, f"{form_name.lower().replace(' ', '_')}_form.png"
+            )
+            self._submit_screenshot_write(screenshot_path, driver.get_screenshot_as_png())
+
+            form = Form(name=form_name, form_id=form_name.lower().replace(" ", "_"))
+            self._extract_form_fields(form_container, form, driver=driver)
+
+            # Only the per-element fallback leaves the submit unset
+            if form.submit_button is None:
+                submit_buttons = form_container.find_elements(By.CSS_SELECTOR, _SUBMIT_BUTTON_SELECTOR)
+                if submit_buttons:
+                    form.submit_button = submit_buttons[0].text
+
+            return form
+        except Exception as e:
+            logger.error(f"Error analyzing form '{form_name}': {e}")
+            traceback.print_exc()
+            return None
+        finally:
+            if driver is not None:
+                driver.quit()
+
+    def _extract_form_fields(self, form_element: webdriver.remote.webelement.WebElement, form: Form,
+                             driver: Optional[webdriver.remote.webdriver.WebDriver] = None) -> None:
         """Extract all fields from the form element.
-        
+
+        Batches every per-element attribute and label read into a single
+        execute_script call so the extraction pays one WebDriver round-trip
+        per form instead of several per field.
+
         Args:
             form_element: The form WebElement to extract fields from
             form: The Form object to populate with fields
+            driver: The driver owning form_element (defaults to the main one)
         """
         try:
-            # Find all input elements in the form
-            inputs = form_element.find_elements(By.XPATH, ".//input")
-            textareas = form_element.find_elements(By.XPATH, ".//textarea")
-            selects = form_element.find_elements(By.XPATH, ".//select")
-            
-            # Process standard inputs
-            for input_elem in inputs:
-                self._process_input_field(input_elem, form)
-            
-            # Process textareas
-            for textarea in textareas:
-                field_id = textarea.get_attribute("id") or ""
-                name = textarea.get_attribute("name") or ""
-                placeholder = textarea.get_attribute("placeholder") or ""
-                required = textarea.get_attribute("required") is not None
-                
-                # Try to find associated label
-                label_text = self._find_label_text(form_element, field_id)
-                
-                field = FormField(
-                    name=name,
-                    field_id=field_id,
-                    field_type="textarea",
-                    label=label_text,
-                    required=required,
-                    placeholder=placeholder
-                )
-                form.fields.append(field)
-            
-            # Process select dropdowns
-            for select in selects:
-                field_id = select.get_attribute("id") or ""
-                name = select.get_attribute("name") or ""
-                required = select.get_attribute("required") is not None
-                
-                # Try to find associated label
-                label_text = self._find_label_text(form_element, field_id)
-                
-                # Get options
-                options = []
-                option_elements = select.find_elements(By.XPATH, ".//option")
-                for option in option_elements:
-                    option_text = option.text
-                    if option_text:
-                        options.append(option_text)
-                
-                field = FormField(
-                    name=name,
-                    field_id=field_id,
-                    field_type="select",
-                    label=label_text,
-                    required=required,
-                    options=options
-                )
-                form.fields.append(field)
-                
+            snapshot = self._snapshot_form_via_js(form_element, driver=driver)
+        except Exception as e:
+            logger.warning(f"Batched field extraction failed, falling back to per-element reads: {e}")
+            self._extract_form_fields_per_element(form_element, form)
+            return
+
+        for raw in snapshot["fields"]:
+            self._process_field_data(raw, form)
+        if snapshot.get("submit"):
+            form.submit_button = snapshot["submit"]
+
+    def _snapshot_form_via_js(self, form_element: webdriver.remote.webelement.WebElement,
+                              driver: Optional[webdriver.remote.webdriver.WebDriver] = None) -> Dict[str, Any]:
+        """Dump a revealed form's fields and submit label in one JS call.
+
+        Args:
+            form_element: The form container WebElement to snapshot
+            driver: The driver owning form_element (defaults to the main one)
+
+        Returns:
+            Dict[str, Any]: {'fields': [...], 'submit': Optional[str]}
+        """
+        return (driver or self.driver).execute_script(_FORM_SNAPSHOT_JS, form_element)
+
+    def _process_field_data(self, raw: Dict[str, Any], form: Form) -> None:
+        """Build a FormField from a batched JS field record and add it to the form.
+
+        Args:
+            raw: One field record returned by the in-page extraction script
+            form: The Form object to add the field to
+        """
+        # textarea/select elements report DOM types like 'select-one';
+        # use the tag name for those and the input type otherwise
+        field_type = raw["type"] if raw["tag"] == "input" else raw["tag"]
+
+        # Skip hidden inputs
+        if field_type == "hidden":
+            return
+
+        name = raw["name"]
+        label_text = raw["label"]
+        value = raw["value"]
+
+        # For checkboxes/radios with the same name (like in a group),
+        # check if we already have this field group
+        if field_type in ["checkbox", "radio"]:
+            existing_field = form.find_field(name, field_type)
+            if existing_field:
+                existing_field.options.append(value or label_text)
+                return
+
+        field = FormField(
+            name=name,
+            field_id=raw["id"],
+            field_type=field_type,
+            label=label_text,
+            required=raw["required"],
+            placeholder=raw["placeholder"]
+        )
+
+        if field_type == "select":
+            field.options = list(raw["options"])
+        elif field_type in ["checkbox", "radio"]:
+            field.options.append(value or label_text)
+
+        form.add_field(field)
+
+    def _extract_form_fields_per_element(self, form_element: webdriver.remote.webelement.WebElement, form: Form) -> None:
+        """Extract fields with one WebDriver call per attribute (fallback path).
+
+        Args:
+            form_element: The form WebElement to extract fields from
+            form: The Form object to populate with fields
+        """
+        try:
+            # One pass over the container's labels up front instead of a
+            # fresh label lookup round-trip per field
+            labels = {
+                label.get_attribute("for"): label.text.strip()
+                for label in form_element.find_elements(By.CSS_SELECTOR, "label[for]")
+            }
+
+            # One CSS query for all field elements instead of three XPath
+            # round-trips; branch on tag name afterwards
+            elements = form_element.find_elements(By.CSS_SELECTOR, _FIELD_ELEMENTS_SELECTOR)
+
+            for elem in elements:
+                tag = elem.tag_name
+
+                # Process standard inputs
+                if tag == "input":
+                    self._process_input_field(elem, form, labels)
+
+                # Process textareas
+                elif tag == "textarea":
+                    field_id = elem.get_attribute("id") or ""
+                    name = elem.get_attribute("name") or ""
+                    placeholder = elem.get_attribute("placeholder") or ""
+                    required = elem.get_attribute("required") is not None
+
+                    # Label resolved via the precomputed map
+                    label_text = labels.get(field_id, "")
+
+                    field = FormField(
+                        name=name,
+                        field_id=field_id,
+                        field_type="textarea",
+                        label=label_text,
+                        required=required,
+                        placeholder=placeholder
+                    )
+                    form.add_field(field)
+
+                # Process select dropdowns
+                elif tag == "select":
+                    field_id = elem.get_attribute("id") or ""
+                    name = elem.get_attribute("name") or ""
+                    required = elem.get_attribute("required") is not None
+
+                    # Label resolved via the precomputed map
+                    label_text = labels.get(field_id, "")
+
+                    # Get options
+                    options = []
+                    option_elements = elem.find_elements(By.CSS_SELECTOR, "option")
+                    for option in option_elements:
+                        option_text = option.text
+                        if option_text:
+                            options.append(option_text)
+
+                    field = FormField(
+                        name=name,
+                        field_id=field_id,
+                        field_type="select",
+                        label=label_text,
+                        required=required,
+                        options=options
+                    )
+                    form.add_field(field)
+
         except Exception as e:
             logger.error(f"Error extracting form fields: {e}")
             traceback.print_exc()
     
-    def _process_input_field(self, input_elem: webdriver.remote.webelement.WebElement, form: Form) -> None:
+    def _process_input_field(self, input_elem: webdriver.remote.webelement.WebElement, form: Form,
+                             labels: Dict[str, str]) -> None:
         """Process an input field and add it to the form.
-        
+
         Args:
             input_elem: The input WebElement to process
             form: The Form object to add the field to
+            labels: Precomputed field-id -> label-text map for the container
         """
         try:
             field_type = input_elem.get_attribute("type") or "text"
@@ -309,8 +748,8 @@ class FormAnalyzer:
             if field_type == "hidden":
                 return
                 
-            # Try to find associated label
-            label_text = self._find_label_text(form.fields[0].label if form.fields else "", field_id)
+            # Label resolved via the precomputed map
+            label_text = labels.get(field_id, "")
             
             # For checkbox/radio inputs within groups, they often share the same name
             # but have different values
@@ -324,17 +763,17 @@ class FormAnalyzer:
                 
                 if parent_label.tag_name == "label":
                     # Get text excluding the input element's text
-                    label_spans = parent_label.find_elements(By.XPATH, ".//span")
+                    label_spans = parent_label.find_elements(By.CSS_SELECTOR, "span")
                     if label_spans:
                         label_text = label_spans[0].text
                     else:
                         # If no span, try to get the label text directly
                         label_text = parent_label.text
                 
-                # For checkboxes/radios with the same name (like in a group), 
+                # For checkboxes/radios with the same name (like in a group),
                 # check if we already have this field group
-                existing_field = next((f for f in form.fields if f.name == name and f.field_type == field_type), None)
-                
+                existing_field = form.find_field(name, field_type)
+
                 if existing_field:
                     # Add this option to the existing field
                     existing_field.options.append(value or label_text)
@@ -353,37 +792,12 @@ class FormAnalyzer:
             if field_type in ["checkbox", "radio"]:
                 field.options.append(value or label_text)
                 
-            form.fields.append(field)
+            form.add_field(field)
                 
         except Exception as e:
             logger.error(f"Error processing input field: {e}")
             traceback.print_exc()
     
-    def _find_label_text(self, parent_element: Any, field_id: str) -> str:
-        """Find the label text for a field.
-        
-        Args:
-            parent_element: The parent element containing the label
-            field_id: The ID of the field to find the label for
-            
-        Returns:
-            str: The label text or empty string if not found
-        """
-        if not field_id:
-            return ""
-            
-        try:
-            # Try to find a label with a 'for' attribute matching the field ID
-            if isinstance(parent_element, webdriver.remote.webelement.WebElement):
-                labels = parent_element.find_elements(By.XPATH, f".//label[@for='{field_id}']")
-                if labels:
-                    return labels[0].text.strip()
-            
-            # If no matching 'for' attribute, return empty string
-            return ""
-        except Exception:
-            return ""
-    
     def analyze_page(self, url: str) -> Dict[str, Any]:
         """Analyze a web page and extract all forms and their fields.
         
@@ -426,11 +840,19 @@ class FormAnalyzer:
             result["error"] = str(e)
             return result
         finally:
-            # Clean up
-            if self.driver:
-                logger.info("Closing browser")
-                helium.kill_browser()
-                self.driver = None
+            # Make sure every queued screenshot reached disk before the
+            # result (which references the paths) is returned
+            self._flush_screenshot_writes()
+            if self.close_on_finish:
+                self.close()
+            elif self.driver:
+                # Keep the browser warm for the next page, but drop
+                # per-page state so analyses don't bleed into each other
+                try:
+                    self.driver.delete_all_cookies()
+                    self.driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+                except Exception as e:
+                    logger.warning(f"Error resetting browser state: {e}")
     
     def generate_helium_script(self, analysis_result: Dict[str, Any]) -> str:
         """Generate a Helium script to fill and submit the forms.
@@ -443,69 +865,59 @@ class FormAnalyzer:
         """
         if not analysis_result["success"] or not analysis_result["forms"]:
             return "# No valid forms found to generate script for"
-        
-        lines = [
-            "# Auto-generated Helium script for form interaction",
-            "from helium import *",
-            "from time import sleep",
-            "",
-            f"# Navigate to the target page",
-            f"go_to('{analysis_result['url']}')",
-            "sleep(2)  # Wait for page to load",
-            ""
-        ]
-        
+
+        buf = io.StringIO()
+        buf.write(_SCRIPT_HEADER_TMPL.substitute(url=analysis_result["url"], fill_js=_FILL_FORM_JS))
+
         # For each form, create a function to fill it
         for form in analysis_result["forms"]:
-            form_name = form["name"].lower().replace(" ", "_")
-            lines.append(f"def fill_{form_name}_form():")
-            lines.append(f"    # Click the {form['name']} button to show the form")
-            lines.append(f"    click('{form['name']}')")
-            lines.append("    sleep(1)  # Wait for form to appear")
-            lines.append("")
-            
-            # Fill each field
-            lines.append("    # Fill form fields")
-            for field in form["fields"]:
-                if field["type"] == "text" or field["type"] == "email" or field["type"] == "password" or field["type"] == "tel" or field["type"] == "date":
-                    lines.append(f"    write('example_{field['name']}', into='{field['label']}')")
-                elif field["type"] == "textarea":
-                    lines.append(f"    write('Sample text for {field['name']}', into='{field['label']}')")
-                elif field["type"] == "select":
-                    if field["options"] and len(field["options"]) > 1:
-                        # Select the second option (index 1) to avoid the placeholder
-                        option = field["options"][1]
-                        lines.append(f"    select('{option}', from_='{field['label']}')")
-                elif field["type"] == "checkbox":
-                    lines.append(f"    click('{field['label']}')")
-                elif field["type"] == "radio":
-                    if field["options"]:
-                        option = field["options"][0]
-                        lines.append(f"    click('{option}')")
-            
+            func_name = form["name"].lower().replace(" ", "_")
+            # Poll for the first fillable field of the revealed form; fall
+            # back to the submit button, then to any form element
+            first_field = next(
+                (f for f in form["fields"]
+                 if f["type"] in ("text", "email", "password", "tel", "date", "textarea")),
+                None,
+            )
+            if first_field:
+                field_ref = first_field["label"] or first_field["name"]
+                ready_condition = f"lambda: TextField('{field_ref}').exists()"
+            elif form["submit_button"]:
+                ready_condition = f"Button('{form['submit_button']}').exists"
+            else:
+                ready_condition = "S('form').exists"
+            buf.write(_FORM_OPEN_TMPL.substitute(
+                func_name=func_name,
+                button_label=form["name"],
+                ready_condition=ready_condition
+            ))
+
+            # Fill every field in one execute_script round-trip
+            payload = _build_fill_payload(form["fields"])
+            buf.write("    # Fill form fields in one WebDriver round-trip\n")
+            buf.write("    get_driver().execute_script(FILL_FORM_JS, {\n")
+            for section in ("values", "checks", "selects"):
+                if section in payload:
+                    buf.write(f"        '{section}': {payload[section]!r},\n")
+            buf.write("    })\n")
+
             # Submit the form
             if form["submit_button"]:
-                lines.append("")
-                lines.append("    # Submit the form")
-                lines.append(f"    click('{form['submit_button']}')")
-                lines.append("    sleep(1)  # Wait for submission")
-                lines.append("    # Handle any confirmation dialogs here if needed")
-            
-            lines.append("")
-        
+                buf.write(_FORM_SUBMIT_TMPL.substitute(submit_button=form["submit_button"]))
+
+            buf.write("\n")
+
         # Add a main section to call each form function
-        lines.append("# Main execution")
-        lines.append("if __name__ == '__main__':")
+        buf.write("# Main execution\n")
+        buf.write("if __name__ == '__main__':\n")
         for form in analysis_result["forms"]:
-            form_name = form["name"].lower().replace(" ", "_")
-            lines.append(f"    fill_{form_name}_form()")
-            lines.append("    # You can add verification code here to check if form submission was successful")
-            lines.append("")
-        
-        lines.append("    # Close the browser when done")
-        lines.append("    kill_browser()")
-        
-        return "\n".join(lines)
+            func_name = form["name"].lower().replace(" ", "_")
+            buf.write(_MAIN_CALL_TMPL.substitute(func_name=func_name))
+
+        buf.write("    # Close the browser when done\n")
+        buf.write("    kill_browser()")
+
+        return buf.getvalue()
     
     def to_json(self, analysis_result: Dict[str, Any], indent: int = 2) -> str:
         """Convert analysis result to a pretty-printed JSON string.
@@ -517,7 +929,7 @@ class FormAnalyzer:
         Returns:
             str: Pretty-printed JSON
         """
-        return json.dumps(analysis_result, indent=indent)
+        return _dumps(analysis_result, indent).decode("utf-8")
     
     def save_result(self, analysis_result: Dict[str, Any], output_file: str = "form_analysis.json") -> bool:
         """Save the analysis result to a JSON file.
@@ -530,8 +942,8 @@ class FormAnalyzer:
             bool: True if saved successfully, False otherwise
         """
         try:
-            with open(output_file, 'w') as f:
-                json.dump(analysis_result, f, indent=2)
+            with open(output_file, 'wb') as f:
+                f.write(_dumps(analysis_result, 2))
             logger.info(f"Analysis result saved to {output_file}")
             return True
         except Exception as e:
@@ -1,70 +1,99 @@
 # Auto-generated Helium script for form interaction
-from helium import *
-from time import sleep
+from helium import (
+    Button,
+    Config,
+    S,
+    TextField,
+    click,
+    get_driver,
+    go_to,
+    kill_browser,
+    wait_until,
+)
+
+# Short-poll field lookups instead of the default 10s implicit wait
+Config.implicit_wait_secs = 1
+
+# Sets every field of a form in one WebDriver round-trip
+FILL_FORM_JS = """\
+const data = arguments[0];
+const find = function (name) {
+    return document.querySelector('[name="' + name + '"], #' + name);
+};
+for (const [name, value] of Object.entries(data.values || {})) {
+    const el = find(name);
+    if (!el) continue;
+    el.value = value;
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+}
+for (const [name, value] of Object.entries(data.checks || {})) {
+    const el = value
+        ? document.querySelector('[name="' + name + '"][value="' + value + '"]')
+        : find(name);
+    if (el && !el.checked) el.click();
+}
+for (const [name, optionText] of Object.entries(data.selects || {})) {
+    const el = document.querySelector('select[name="' + name + '"], select#' + name);
+    if (!el) continue;
+    for (const opt of el.options) {
+        if (opt.text === optionText) { el.value = opt.value; break; }
+    }
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+}"""
 
 # Navigate to the target page
 go_to('http://localhost:5174')
-sleep(2)  # Wait for page to load
+wait_until(S('body').exists)  # Wait for page to load
 
 def fill_login_form_form():
     # Click the Login Form button to show the form
     click('Login Form')
-    sleep(1)  # Wait for form to appear
+    wait_until(lambda: TextField('email').exists(), timeout_secs=5)  # Wait for form to appear
 
-    # Fill form fields
-    write('example_email', into='')
-    write('example_password', into='')
-    click('Remember me')
+    # Fill form fields in one WebDriver round-trip
+    get_driver().execute_script(FILL_FORM_JS, {
+        'values': {'email': 'example_email', 'password': 'example_password'},
+        'checks': {'rememberMe': ''},
+    })
 
     # Submit the form
     click('Log In')
-    sleep(1)  # Wait for submission
+    wait_until(lambda: not Button('Log In').exists(), timeout_secs=5)
     # Handle any confirmation dialogs here if needed
 
 def fill_signup_form_form():
     # Click the Signup Form button to show the form
     click('Signup Form')
-    sleep(1)  # Wait for form to appear
-
-    # Fill form fields
-    write('example_firstName', into='')
-    write('example_lastName', into='')
-    write('example_email', into='')
-    write('example_phone', into='')
-    write('example_password', into='')
-    write('example_confirmPassword', into='')
-    write('example_birthDate', into='')
-    write('example_occupation', into='')
-    click('Technology')
-    click('I accept the Terms and Conditions')
-    select('Male', from_='Gender')
-    select('United States', from_='Country')
+    wait_until(lambda: TextField('firstName').exists(), timeout_secs=5)  # Wait for form to appear
+
+    # Fill form fields in one WebDriver round-trip
+    get_driver().execute_script(FILL_FORM_JS, {
+        'values': {'firstName': 'example_firstName', 'lastName': 'example_lastName', 'email': 'example_email', 'phone': 'example_phone', 'password': 'example_password', 'confirmPassword': 'example_confirmPassword', 'birthDate': 'example_birthDate', 'occupation': 'example_occupation'},
+        'checks': {'interests': 'technology', 'termsAccepted': ''},
+        'selects': {'gender': 'Male', 'country': 'United States'},
+    })
 
     # Submit the form
     click('Create Account')
-    sleep(1)  # Wait for submission
+    wait_until(lambda: not Button('Create Account').exists(), timeout_secs=5)
     # Handle any confirmation dialogs here if needed
 
 def fill_activity_form_form():
     # Click the Activity Form button to show the form
     click('Activity Form')
-    sleep(1)  # Wait for form to appear
-
-    # Fill form fields
-    write('example_activityName', into='')
-    write('example_location', into='')
-    write('example_date', into='')
-    write('example_participants', into='')
-    click('low')
-    click('This activity requires equipment')
-    click('Email')
-    write('Sample text for description', into='Description')
-    select('Meeting', from_='Activity Type')
-    select('Daily', from_='Recurrence')
+    wait_until(lambda: TextField('activityName').exists(), timeout_secs=5)  # Wait for form to appear
+
+    # Fill form fields in one WebDriver round-trip
+    get_driver().execute_script(FILL_FORM_JS, {
+        'values': {'activityName': 'example_activityName', 'location': 'example_location', 'date': 'example_date', 'startTime': 'example_startTime', 'endTime': 'example_endTime', 'participants': 'example_participants', 'description': 'Sample text for description'},
+        'checks': {'priority': 'low', 'needsEquipment': '', 'notifications': 'email'},
+        'selects': {'activityType': 'Meeting', 'recurrence': 'Daily'},
+    })
 
     # Submit the form
     click('Schedule Activity')
-    sleep(1)  # Wait for submission
+    wait_until(lambda: not Button('Schedule Activity').exists(), timeout_secs=5)
     # Handle any confirmation dialogs here if needed
 
 # Main execution
@@ -79,4 +108,4 @@ if __name__ == '__main__':
     # You can add verification code here to check if form submission was successful
 
     # Close the browser when done
-    kill_browser()
\ No newline at end of file
+    kill_browser()
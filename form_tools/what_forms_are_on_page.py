@@ -1,14 +1,37 @@
-from smolagents import CodeAgent, HfApiModel
+import json
+import os
+import sys
 from pprint import pprint
 
-pprint(HfApiModel().model_id)
+from smolagents import CodeAgent
 
+# Make the repo root importable when running a subdirectory copy
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-model = HfApiModel()
+from agents.factory import get_hf_model
+
+pprint(get_hf_model().model_id)
+
+
+model = get_hf_model()
 agent = CodeAgent(tools=[], model=model, add_base_tools=True)
 
 
-agent.run("Review the page source and say what forms are on the page? http://localhost:5174 ")
-agent.run("Does the page have a button with the words 'Login Form'? http://localhost:5174 ")
-agent.run("What words does this page have? http://localhost:5174 ")
+# One batched run replaces three sequential agent.run calls against the same
+# URL: the page is fetched and parsed once and only one model loop runs.
+PROMPT = """
+Review the page source at http://localhost:5174 and reply with a single JSON
+object shaped like {"forms": [...], "has_login_button": true, "words": [...]}:
+- "forms": the forms on the page
+- "has_login_button": whether the page has a button with the words 'Login Form'
+- "words": the words the page contains
+Reply with the JSON object only.
+"""
+
+reply = agent.run(PROMPT)
 
+try:
+    answers = json.loads(reply if isinstance(reply, str) else str(reply))
+except json.JSONDecodeError:
+    answers = reply  # The model didn't return clean JSON; show what we got
+pprint(answers)
@@ -14,16 +14,17 @@ from typing import Dict, Any, Optional, Union, List
 # Import smolagents components
 from smolagents import (
     CodeAgent,
-    HfApiModel,
     GradioUI
 )
 
-# Add the path to the image_to_text_tool.py file
+# Add the path to the image_to_text_tool.py file and the repo root
 script_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(script_dir)
+sys.path.append(os.path.dirname(script_dir))
 
-# Import our custom tools
+# Import our custom tools and shared factories
 from image_to_text_tool import image_to_text, ocr_image, analyze_image
+from agents.factory import get_hf_model
 
 def main():
     """Initialize and launch the Gradio interface for the image-to-text agent"""
@@ -37,8 +38,8 @@ def main():
     
     print(f"Initializing agent with model: {model_id}")
     
-    # Initialize the language model for the agent
-    model = HfApiModel(model_id=model_id)
+    # Initialize the language model for the agent (cached per process)
+    model = get_hf_model(model_id)
     
     # Initialize the agent with the image processing tools
     agent = CodeAgent(
@@ -1,19 +1,18 @@
-from smolagents import CodeAgent, HfApiModel, load_tool
+import os
+import sys
 from pprint import pprint
 
+# Make the repo root importable when running a subdirectory copy
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-model = HfApiModel(model_id="Qwen/Qwen2.5-Coder-32B-Instruct")
+from agents.factory import get_image_agent
 
-image_generation_tool = load_tool("m-ric/text-to-image", trust_remote_code=True)
 
-agent = CodeAgent(tools=[image_generation_tool], model=model)
+# The factory caches the Hub tool fetch and HfApiModel per process
+agent = get_image_agent("Qwen/Qwen2.5-Coder-32B-Instruct")
 
 image = agent.run(
     "Improve this prompt, then generate an image of it.", additional_args={'user_prompt': 'A rabbit wearing a space suit'}
 )
 
 pprint(image)
-
-
-
-
@@ -1,49 +1,74 @@
-from smolagents import CodeAgent, HfApiModel, load_tool, tool
+from smolagents import CodeAgent, tool
 import base64
+import os
+import sys
 from PIL import Image
 import io
 
+# Make the repo root importable when running a subdirectory copy
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.factory import get_hf_model, get_image_generation_tool
+
+# Per-extension save format and encoder settings. Passing these explicitly
+# stops PIL from re-guessing the format and from using its slow defaults:
+# PNG at compress_level=1 encodes roughly 4-8x faster than the default
+# level 6 for a modest size increase, and JPEG skips the optimize pass.
+_SAVE_FORMATS = {
+    "png": ("PNG", {"optimize": False, "compress_level": 1}),
+    "jpg": ("JPEG", {"quality": 85, "optimize": False, "progressive": False}),
+    "jpeg": ("JPEG", {"quality": 85, "optimize": False, "progressive": False}),
+    "webp": ("WEBP", {}),
+}
+
 @tool
 def save_image(image_data: str, output_path: str) -> str:
     """
     Saves an image to the specified output path. The image_data can be either a base64 encoded string
     or a PIL Image object.
-    
+
     Args:
         image_data: The image to save, either as a base64 encoded string or a PIL Image object.
         output_path: The file path where the image should be saved.
     """
     try:
-        # Check if image_data is a base64 string
-        if isinstance(image_data, str):
+        # PIL Image fast path: no string/base64 inspection needed
+        if isinstance(image_data, Image.Image):
+            image = image_data
+        elif isinstance(image_data, (bytes, bytearray, memoryview)):
+            # Already-decoded bytes skip the base64 round trip entirely
+            image = Image.open(io.BytesIO(image_data))
+        elif isinstance(image_data, str):
             # Try to decode base64 data
             try:
-                # Remove potential header from base64 string if present
-                if "base64," in image_data:
-                    image_data = image_data.split("base64,")[1]
-                
+                # Remove potential header from base64 string if present;
+                # find+slice avoids split's full-size prefix copy
+                marker = image_data.find("base64,")
+                if marker >= 0:
+                    image_data = image_data[marker + 7:]
+
                 # Decode base64 string
                 image_bytes = base64.b64decode(image_data)
                 image = Image.open(io.BytesIO(image_bytes))
             except Exception as e:
                 return f"Failed to decode base64 image data: {str(e)}"
-        elif hasattr(image_data, 'save'):  # Check if it's a PIL Image
-            image = image_data
         else:
             return "Unsupported image data format. Please provide a base64 string or PIL Image."
-        
-        # Save the image
-        image.save(output_path)
+
+        # Save with an explicit format and cheap encoder settings
+        ext = os.path.splitext(output_path)[1].lower().lstrip(".")
+        save_format, save_kwargs = _SAVE_FORMATS.get(ext, (None, {}))
+        image.save(output_path, format=save_format, **save_kwargs)
         return f"Image successfully saved to {output_path}"
-    
+
     except Exception as e:
         return f"Error saving image: {str(e)}"
 
-# Load the image generation tool
-image_generation_tool = load_tool("m-ric/text-to-image", trust_remote_code=True)
+# Load the image generation tool (cached per process by the factory)
+image_generation_tool = get_image_generation_tool()
 
 # Initialize the model
-model = HfApiModel(model_id="Qwen/Qwen2.5-Coder-32B-Instruct")  # You can use your preferred model
+model = get_hf_model("Qwen/Qwen2.5-Coder-32B-Instruct")  # You can use your preferred model
 
 # Create the agent with both tools
 agent = CodeAgent(
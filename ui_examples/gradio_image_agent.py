@@ -1,19 +1,17 @@
-from smolagents import (
-    load_tool,
-    CodeAgent,
-    HfApiModel,
-    GradioUI
-)
+import os
+import sys
 
-model_id = "Qwen/Qwen2.5-Coder-32B-Instruct"
+from smolagents import GradioUI
+
+# Make the repo root importable when running a subdirectory copy
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from agents.factory import get_image_agent
 
-# Import tool from Hub
-image_generation_tool = load_tool("m-ric/text-to-image", trust_remote_code=True)
+model_id = "Qwen/Qwen2.5-Coder-32B-Instruct"
 
-model = HfApiModel(model_id=model_id)
 
-# Initialize the agent with the image generation tool
-agent = CodeAgent(tools=[image_generation_tool], model=model)
+# The factory caches the Hub tool fetch and HfApiModel per process
+agent = get_image_agent(model_id)
 
 GradioUI(agent).launch()
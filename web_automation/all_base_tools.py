@@ -1,11 +1,19 @@
-from smolagents import CodeAgent, DuckDuckGoSearchTool, HfApiModel
+import os
+import sys
 from pprint import pprint
 
-pprint(HfApiModel().model_id)
+from smolagents import CodeAgent
 
+# Make the repo root importable when running a subdirectory copy
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-model = HfApiModel()
-agent = CodeAgent(tools=[DuckDuckGoSearchTool()], model=model, add_base_tools=True)
+from agents.factory import get_hf_model, get_search_tool
+
+pprint(get_hf_model().model_id)
+
+
+model = get_hf_model()
+agent = CodeAgent(tools=[get_search_tool()], model=model, add_base_tools=True)
 
 
 agent.run("Generate a pink and blue smiley face. If you don't have image generation say so.")
@@ -19,4 +27,3 @@ agent.run(""""
 
     If you have access to image generation, please also create an artistic representation of a quantum computer."
     """)
-#
\ No newline at end of file
@@ -1,42 +1,49 @@
-from smolagents import CodeAgent, DuckDuckGoSearchTool, HfApiModel
-
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pprint import pprint
 
+from smolagents import CodeAgent
+
+# Make the repo root importable when running a subdirectory copy
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.factory import get_hf_model, get_search_tool
+
 def main():
-    # Initialize the HfApiModel
+    # Initialize the HfApiModel (cached per process)
     # This will use the Hugging Face API with the default model
-    model = HfApiModel()
-    
+    model = get_hf_model()
+
     # Print the model ID being used
     print("Using model:")
     pprint(model.model_id)
-    
-    # Initialize the agent with tools
-    # Using both DuckDuckGo search and web browser capabilities
-    agent = CodeAgent(
-        tools=[
-            DuckDuckGoSearchTool(),
-        ],
-        model=model
-    )
-    
+
     # Example queries
     queries = [
         "How long does it take to get to the moon with a Saturn 5 rocket?",
         "What are the main features of Python 3.10?",
         "Find the latest news about artificial intelligence."
     ]
-    
-    # Run the agent with each query
-    for query in queries:
+
+    # Each agent.run is I/O bound on HTTP, so the queries overlap on a
+    # thread pool. agent.run keeps per-run state and isn't thread-safe,
+    # so each worker builds its own agent around the shared model and the
+    # shared search tool (one pooled HTTP client per process).
+    def run_query(query: str) -> str:
+        agent = CodeAgent(tools=[get_search_tool()], model=model)
+        return agent.run(query)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        responses = list(executor.map(run_query, queries))
+
+    for query, response in zip(queries, responses):
         print("\n" + "="*50)
         print(f"QUERY: {query}")
         print("="*50)
-        
-        response = agent.run(query)
-        
+
         print("\nRESPONSE:")
         print(response)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -4,27 +4,33 @@
 Adapted from: https://github.com/huggingface/notebooks/blob/main/smolagents_doc/en/pytorch/web_browser.ipynb
 """
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-from time import sleep
+from time import monotonic, sleep
+import atexit
+import base64
+import functools
 import os
 import logging
+import re
 import traceback
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional
 import datetime
 
-# Third-party imports
-import helium
+# Third-party imports. helium drags in most of selenium at import time and
+# smolagents pulls in its model stack, so everything heavyweight is imported
+# lazily inside the functions that need it; only the @tool decorator is
+# required while this module is being defined.
 from dotenv import load_dotenv
-from PIL import Image
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
 
 # Local imports
-from smolagents import CodeAgent, HfApiModel, tool
-from smolagents.agents import ActionStep
+from smolagents import tool
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+    from smolagents import CodeAgent
+    from smolagents.agents import ActionStep
 
 # Set up logging
 logging.basicConfig(
@@ -40,6 +46,134 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+def _xpath_literal(text: str) -> str:
+    """Quote a string as an XPath 1.0 literal.
+
+    Needles containing a single quote previously broke the expression (and
+    with it, the browser's fast XPath path); such strings are wrapped with
+    concat() since XPath 1.0 has no escaping.
+    """
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    parts = "', \"'\", '".join(text.split("'"))
+    return f"concat('{parts}')"
+
+@functools.lru_cache(maxsize=64)
+def _ctrl_f_xpath(text: str) -> str:
+    """Build (and cache) the body-scoped XPath expression for a search needle."""
+    return f".//*[contains(text(), {_xpath_literal(text)})]"
+
+# Install window.__runXpath once per page, then delegate to it. The helper
+# evaluates a body-scoped expression and returns the match count plus the nth
+# matching element; compiled XPathExpression objects live in
+# window.__xpathCache so repeated searches never re-parse. The count() query
+# runs first as a plain NUMBER_TYPE evaluation, and only when the requested
+# occurrence exists is a second (expr)[nth] query made for just that node -
+# no full node snapshot is ever materialized.
+_RUN_XPATH_JS = """
+if (!window.__runXpath) {
+    window.__xpathCache = {};
+    window.__runXpath = function (expr, nth) {
+        function compiled(e) {
+            let c = window.__xpathCache[e];
+            if (!c) {
+                c = new XPathEvaluator().createExpression(e);
+                window.__xpathCache[e] = c;
+            }
+            return c;
+        }
+        const count = compiled('count(' + expr + ')').evaluate(
+            document.body, XPathResult.NUMBER_TYPE, null).numberValue;
+        if (nth > count) {
+            return {count: count, found: false};
+        }
+        const target = compiled('(' + expr + ')[' + nth + ']').evaluate(
+            document.body, XPathResult.FIRST_ORDERED_NODE_TYPE,
+            null).singleNodeValue;
+        target.scrollIntoView(true);
+        target.style.backgroundColor = 'yellow';
+        return {count: count, found: true};
+    };
+}
+return window.__runXpath(arguments[0], arguments[1]);
+"""
+
+# Primary search path: one TreeWalker sweep over document.body builds a flat
+# {element, text} index that subsequent searches match in memory with
+# String.includes, instead of re-walking the DOM with an XPath predicate per
+# call. A MutationObserver drops the index whenever the DOM changes, so the
+# next search rebuilds it; navigation clears the window object and resets
+# everything for free.
+_TEXT_INDEX_JS = """
+const needle = arguments[0];
+const nth = arguments[1];
+if (!window.__textIndex) {
+    const entries = [];
+    const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+    let node;
+    while ((node = walker.nextNode())) {
+        if (node.nodeValue && node.nodeValue.trim()) {
+            entries.push({el: node.parentElement, text: node.nodeValue});
+        }
+    }
+    window.__textIndex = entries;
+    if (!window.__textIndexObserver) {
+        window.__textIndexObserver = new MutationObserver(() => {
+            window.__textIndex = null;
+        });
+        window.__textIndexObserver.observe(document.body, {
+            childList: true, subtree: true, characterData: true});
+    }
+}
+const hits = window.__textIndex.filter(entry => entry.text.includes(needle));
+if (nth > hits.length) {
+    return {count: hits.length, found: false};
+}
+const el = hits[nth - 1].el;
+el.scrollIntoView(true);
+el.style.backgroundColor = 'yellow';
+return {count: hits.length, found: true};
+"""
+
+# Return the page text only when the caller's cached snapshot key is stale.
+# A MutationObserver bumps a generation counter on DOM changes, so the key
+# (URL + generation) identifies one exact state of the page.
+_TEXT_SNAPSHOT_JS = """
+window.__textGen = window.__textGen || 1;
+if (!window.__textGenObserver) {
+    window.__textGenObserver = new MutationObserver(() => { window.__textGen++; });
+    window.__textGenObserver.observe(document.body, {
+        childList: true, subtree: true, characterData: true});
+}
+const key = location.href + '#' + window.__textGen;
+if (key === arguments[0]) {
+    return {key: key, text: null};
+}
+return {key: key, text: document.body.textContent};
+"""
+
+_page_text_cache: dict = {"key": None, "text": ""}
+
+@functools.lru_cache(maxsize=64)
+def _needle_pattern(text: str) -> "re.Pattern[str]":
+    """Compile (and cache) the literal search pattern for a needle."""
+    return re.compile(re.escape(text))
+
+def _page_contains(text: str) -> bool:
+    """Cheap pre-screen: match the needle against a cached text snapshot.
+
+    The snapshot is refetched only when the page's URL or mutation
+    generation changed, so repeated searches against the same page state
+    cost one tiny round-trip plus an in-process regex scan.
+    """
+    snapshot = driver.execute_script(_TEXT_SNAPSHOT_JS, _page_text_cache["key"])
+    if snapshot["text"] is not None:
+        _page_text_cache["key"] = snapshot["key"]
+        _page_text_cache["text"] = snapshot["text"]
+    return _needle_pattern(text).search(_page_text_cache["text"]) is not None
+
 @tool
 def search_item_ctrl_f(text: str, nth_result: int = 1) -> str:
     """
@@ -51,20 +185,39 @@ def search_item_ctrl_f(text: str, nth_result: int = 1) -> str:
     global driver
     if driver is None:
         return "Browser not initialized"
-    
+
+    from selenium.common.exceptions import WebDriverException
+
     logger.info(f"Searching for text: '{text}' (match #{nth_result})")
-    elements = driver.find_elements(By.XPATH, f"//*[contains(text(), '{text}')]")
-    if nth_result > len(elements):
-        msg = f"Match n°{nth_result} not found (only {len(elements)} matches found)"
+    # Pre-screen against the cached page text: when the needle isn't on the
+    # page at all, skip the DOM query entirely
+    try:
+        if not _page_contains(text):
+            msg = f"Match n°{nth_result} not found (only 0 matches found)"
+            logger.warning(msg)
+            raise Exception(msg)
+    except WebDriverException:
+        pass  # Snapshot unavailable; let the DOM search decide
+
+    # The text index does an in-memory substring match over a one-time
+    # TreeWalker snapshot; the scoped document.evaluate path is kept as a
+    # fallback in case the index script cannot run on the current page.
+    # Either way the script scrolls to and highlights the match itself, so
+    # only {count, found} crosses the wire - no WebElement marshalling.
+    try:
+        found = driver.execute_script(_TEXT_INDEX_JS, text, nth_result)
+    except WebDriverException:
+        logger.debug("Text index unavailable, falling back to XPath search")
+        found = driver.execute_script(_RUN_XPATH_JS, _ctrl_f_xpath(text), nth_result)
+    count = int(found["count"])
+    if not found["found"]:
+        msg = f"Match n°{nth_result} not found (only {count} matches found)"
         logger.warning(msg)
         raise Exception(msg)
-    
-    result = f"Found {len(elements)} matches for '{text}'."
-    elem = elements[nth_result - 1]
-    driver.execute_script("arguments[0].scrollIntoView(true);", elem)
-    driver.execute_script("arguments[0].style.backgroundColor = 'yellow';", elem)  # Highlight the element
+
+    result = f"Found {count} matches for '{text}'."
     sleep(0.5)  # Brief pause to make highlighting visible
-    result += f" Focused on element {nth_result} of {len(elements)}"
+    result += f" Focused on element {nth_result} of {count}"
     logger.info(result)
     return result
 
@@ -90,10 +243,31 @@ def close_popups() -> str:
     if driver is None:
         return "Browser not initialized"
     
+    from selenium import webdriver
+    from selenium.webdriver.common.keys import Keys
+
     logger.info("Attempting to close popups with ESC key")
     webdriver.ActionChains(driver).send_keys(Keys.ESCAPE).perform()
     return "Sent escape key to close any popups"
 
+def _capture_screenshot_bytes(image_format: str = "png", **params) -> bytes:
+    """Capture the current page over CDP, returning the encoded image bytes.
+
+    Goes straight to Page.captureScreenshot with optimizeForSpeed, skipping
+    the WebDriver screenshot endpoint's extra encode/decode round-trips,
+    and never renders beyond the visible viewport.
+    """
+    capture = driver.execute_cdp_cmd(
+        "Page.captureScreenshot",
+        {
+            "format": image_format,
+            "optimizeForSpeed": True,
+            "captureBeyondViewport": False,
+            **params,
+        },
+    )
+    return base64.b64decode(capture["data"])
+
 @tool
 def save_manual_screenshot(filename: Optional[str] = None) -> str:
     """
@@ -114,20 +288,94 @@ def save_manual_screenshot(filename: Optional[str] = None) -> str:
     os.makedirs(screenshots_dir, exist_ok=True)
     
     filepath = os.path.join(screenshots_dir, filename)
-    driver.save_screenshot(filepath)
+    with open(filepath, "wb") as screenshot_file:
+        screenshot_file.write(_capture_screenshot_bytes())
     logger.info(f"Screenshot saved to {os.path.abspath(filepath)}")
     return f"Screenshot saved to {os.path.abspath(filepath)}"
 
-# Configure Chrome options
-chrome_options = webdriver.ChromeOptions()
-chrome_options.add_argument("--force-device-scale-factor=1")
-chrome_options.add_argument("--window-size=1000,1350")
-chrome_options.add_argument("--disable-pdf-viewer")
-chrome_options.add_argument("--window-position=0,0")
+@functools.lru_cache(maxsize=1)
+def _build_chrome_options() -> "webdriver.ChromeOptions":
+    """Configure the shared Chrome options, importing selenium on demand."""
+    from selenium import webdriver
+
+    chrome_options = webdriver.ChromeOptions()
+    chrome_options.add_argument("--force-device-scale-factor=1")
+    chrome_options.add_argument("--window-size=1000,1350")
+    chrome_options.add_argument("--disable-pdf-viewer")
+    chrome_options.add_argument("--window-position=0,0")
+
+    # Headless by default: the agent only consumes CDP screenshots, so the
+    # visible window's GPU compositing and window-manager work is pure
+    # overhead. Set SMOL_HEADLESS=0 to watch a run for debugging.
+    if os.environ.get("SMOL_HEADLESS", "1") != "0":
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+    return chrome_options
 
 # Initialize the browser - we'll do this lazily to avoid errors on import
 driver = None
 
+# Symlink to the last chromedriver webdriver_manager resolved; when present,
+# browser startup skips the manager (and its network version check) entirely
+_CHROMEDRIVER_CACHE_LINK = os.path.expanduser("~/.cache/smol_web_agents/chromedriver")
+
+@functools.lru_cache(maxsize=1)
+def _resolve_chromedriver_path() -> str:
+    """Locate a chromedriver binary, consulting webdriver_manager at most once.
+
+    Repeated calls within a process hit the lru_cache; across processes the
+    cache symlink avoids re-running ChromeDriverManager. The PATH prepend
+    lives here too and is idempotent instead of growing PATH on every
+    browser restart.
+    """
+    if os.path.exists(_CHROMEDRIVER_CACHE_LINK):
+        chrome_driver_path = os.path.realpath(_CHROMEDRIVER_CACHE_LINK)
+    else:
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        chrome_driver_path = ChromeDriverManager().install()
+        os.makedirs(os.path.dirname(_CHROMEDRIVER_CACHE_LINK), exist_ok=True)
+        try:
+            os.symlink(chrome_driver_path, _CHROMEDRIVER_CACHE_LINK)
+        except OSError:
+            pass  # The cache link is best-effort; next startup pays again
+    driver_dir = os.path.dirname(chrome_driver_path)
+    if driver_dir not in os.environ["PATH"].split(os.pathsep):
+        os.environ["PATH"] = driver_dir + os.pathsep + os.environ["PATH"]
+    return chrome_driver_path
+
+# Background writer for the on-disk debug screenshot copies, so the agent
+# loop never blocks on disk I/O. Registered for a draining shutdown at exit
+# so no queued screenshot is lost.
+_screenshot_writer = ThreadPoolExecutor(max_workers=2, thread_name_prefix="screenshot-io")
+atexit.register(_screenshot_writer.shutdown, wait=True)
+
+def _write_screenshot_file(path: str, payload: bytes) -> None:
+    """Write one debug screenshot copy; runs on the background writer."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as screenshot_file:
+            screenshot_file.write(payload)
+        logger.info(f"Screenshot saved to disk: {path}")
+    except OSError as e:
+        logger.error(f"Error writing screenshot to {path}: {e}")
+
+# Clip for per-step captures: the vision model downscales to ~768 px on the
+# long side anyway, so rendering at 3/4 scale roughly halves the bytes moved
+# through capture, transfer and decode with no loss downstream. Dimensions
+# track the --window-size launch argument.
+_CAPTURE_CLIP = {"x": 0, "y": 0, "width": 1000, "height": 1350, "scale": 0.75}
+
+# Sidecar store of live screenshots keyed by step number, capped at the two
+# most recent. The store owns the strong references: evicting an entry drops
+# the image and clears the evicted step's observations_images on the spot,
+# so old pixels are freed deterministically even while the ActionStep object
+# itself stays in agent memory.
+_SCREENSHOT_STORE_CAPACITY = 2
+_screenshot_store: OrderedDict = OrderedDict()
+
 def initialize_browser():
     global driver
     if driver is not None:
@@ -135,22 +383,17 @@ def initialize_browser():
         return True
     
     try:
+        import helium
+
         logger.info("Initializing Chrome browser...")
 
-        chrome_driver_path = ChromeDriverManager().install()
-        os.environ["PATH"] = (
-            os.path.dirname(chrome_driver_path) + os.pathsep + os.environ["PATH"]
-        )
-        
-        # Setup Chrome options
-        chrome_options = webdriver.ChromeOptions()
-        chrome_options.add_argument("--force-device-scale-factor=1")
-        chrome_options.add_argument("--window-size=1000,1350")
-        chrome_options.add_argument("--disable-pdf-viewer")
-        chrome_options.add_argument("--window-position=0,0")
-        # chrome_options.add_argument("--headless")  # uncomment if needed
-
-        driver = helium.start_chrome(headless=False, options=chrome_options)
+        _resolve_chromedriver_path()
+
+        # Reuse the memoized chrome options rather than rebuilding an
+        # identical options object on every (re)initialization
+        driver = helium.start_chrome(headless=False, options=_build_chrome_options())
+        # One teardown at process exit; tasks share the session in between
+        atexit.register(helium.kill_browser)
         logger.info("Browser initialized successfully!")
         return True
     except Exception as e:
@@ -159,37 +402,91 @@ def initialize_browser():
         return False
 
 
+def reset_browser_state() -> None:
+    """Clear cache, cookies and storage so tasks don't leak into each other.
+
+    Wiping state over CDP and parking on about:blank costs milliseconds,
+    versus the full Chrome cold start a kill-and-relaunch would pay.
+    """
+    from selenium.common.exceptions import WebDriverException
+
+    global driver
+    if driver is None:
+        return
+    try:
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd(
+            "Storage.clearDataForOrigin", {"origin": "*", "storageTypes": "all"}
+        )
+        driver.get("about:blank")
+    except WebDriverException as e:
+        logger.warning(f"Failed to reset browser state: {e}")
+
+
+
+# The page is ready for a screenshot once loading has finished and no
+# animation is still running
+_PAGE_SETTLED_JS = """
+return document.readyState === 'complete'
+    && document.getAnimations().every(a => a.playState !== 'running');
+"""
+
+def _wait_until_settled(timeout: float = 1.5) -> None:
+    """Poll until the page has settled, capping the wait at `timeout` seconds."""
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.05).until(
+            lambda d: d.execute_script(_PAGE_SETTLED_JS)
+        )
+    except TimeoutException:
+        # The page never settled within the budget; capture anyway
+        pass
 
 # Enhanced screenshot callback with more information
-def save_screenshot(memory_step: ActionStep, agent: CodeAgent) -> None:
+def save_screenshot(memory_step: "ActionStep", agent: "CodeAgent") -> None:
+    from PIL import Image
+
     logger.info(f"Taking screenshot for step {memory_step.step_number}")
-    sleep(1.5)  # Let JavaScript animations happen before taking the screenshot
     global driver
     
     if driver is None:
         logger.warning("No driver available for screenshot")
         return
-        
+
+    _wait_until_settled()  # Let JavaScript animations finish before capturing
     current_step = memory_step.step_number
     try:
-        # Remove previous screenshots for lean processing
-        for previous_memory_step in agent.memory.steps:
-            if isinstance(previous_memory_step, ActionStep) and previous_memory_step.step_number <= current_step - 2:
-                previous_memory_step.observations_images = None
-        
-        # Save screenshot
-        png_bytes = driver.get_screenshot_as_png()
-        image = Image.open(BytesIO(png_bytes))
+        # Capture via CDP as WebP: Chrome's optimizeForSpeed encoder is far
+        # cheaper than the default PNG path, and the smaller payload also
+        # shrinks the base64 transfer back to Python
+        webp_bytes = _capture_screenshot_bytes("webp", quality=60, clip=_CAPTURE_CLIP)
+        image = Image.open(BytesIO(webp_bytes))
         logger.info(f"Captured browser screenshot: {image.size} pixels")
-        memory_step.observations_images = [image.copy()]  # Create a copy to ensure it persists
-        
-        # Optionally save to disk for debugging
-        screenshots_dir = "screenshots"
-        os.makedirs(screenshots_dir, exist_ok=True)
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        screenshot_path = os.path.join(screenshots_dir, f"step_{current_step}_{timestamp}.png")
-        image.save(screenshot_path)
-        logger.info(f"Screenshot saved to disk: {screenshot_path}")
+        # Hand the image over directly: the copy() previously made here
+        # duplicated ~5 MB of decoded pixels per step for no benefit, since
+        # the step's image is only dropped once the store below evicts it
+        memory_step.observations_images = [image]
+
+        # Remove previous screenshots for lean processing: O(1) sidecar
+        # eviction instead of rescanning agent.memory.steps every step
+        _screenshot_store[current_step] = (memory_step, image)
+        while len(_screenshot_store) > _SCREENSHOT_STORE_CAPACITY:
+            _, (evicted_step, _evicted_image) = _screenshot_store.popitem(last=False)
+            evicted_step.observations_images = None
+
+        # The debug copy on disk is opt-in: the image already lives on the
+        # memory step, so only duplicate it when someone will actually look
+        if getattr(agent, "verbosity_level", 0) >= 3 or os.environ.get("SMOL_DEBUG_SCREENSHOTS"):
+            # A monotonic millisecond tag keeps filenames unique without
+            # strftime's per-call formatting and timezone work; the
+            # human-readable timestamp stays in save_manual_screenshot
+            screenshot_path = os.path.join(
+                "screenshots", f"step_{current_step}_{int(monotonic() * 1000)}.webp"
+            )
+            _screenshot_writer.submit(_write_screenshot_file, screenshot_path, webp_bytes)
         
         # Update observations with current URL and page title
         url_info = f"Current URL: {driver.current_url}"
@@ -204,7 +501,7 @@ def save_screenshot(memory_step: ActionStep, agent: CodeAgent) -> None:
         traceback.print_exc()
 
 # Progress callback to provide real-time feedback
-def log_progress(memory_step: ActionStep, agent: CodeAgent) -> None:
+def log_progress(memory_step: "ActionStep", agent: "CodeAgent") -> None:
     current_step = memory_step.step_number
     logger.info(f"Completed step {current_step}/{agent.max_steps}: {memory_step.action if hasattr(memory_step, 'action') else 'Thinking...'}")
     
@@ -216,6 +513,8 @@ def create_agent(model_id: str = "meta-llama/Llama-3.3-70B-Instruct", max_steps:
     """Create and configure the agent with specified model"""
     logger.info(f"Initializing agent with model: {model_id}")
     try:
+        from smolagents import CodeAgent, HfApiModel
+
         # Initialize the model
         model = HfApiModel(model_id=model_id)
         
@@ -310,11 +609,12 @@ def run_with_feedback(task_name, request_text, model_id=None, max_steps=20):
     print(f"Starting task: {task_name}")
     print(f"{'=' * 50}")
     
-    # Initialize browser
+    # Initialize browser (reused across tasks; state is wiped between runs)
     if not initialize_browser():
         print("❌ Failed to initialize browser - see logs for details")
         return False
-    
+    reset_browser_state()
+
     # Create agent
     agent = create_agent(model_id=model_id or "meta-llama/Llama-3.3-70B-Instruct", max_steps=max_steps)
     if agent is None:
@@ -394,10 +694,13 @@ def test_browser():
     if not initialize_browser():
         print("❌ Failed to initialize browser")
         return False
-    
+    reset_browser_state()
+
     print("✅ Browser initialized successfully!")
     
     try:
+        import helium
+
         print("🌐 Navigating to example.com...")
         helium.go_to("https://example.com")
         sleep(2)  # Wait for page to load
@@ -409,8 +712,8 @@ def test_browser():
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         screenshot_path = os.path.join(screenshots_dir, f"browser_test_{timestamp}.png")
         
-        driver = helium.get_driver()
-        driver.save_screenshot(screenshot_path)
+        with open(screenshot_path, "wb") as screenshot_file:
+            screenshot_file.write(_capture_screenshot_bytes())
         print(f"📸 Screenshot saved to {os.path.abspath(screenshot_path)}")
         
         print("✅ Test completed successfully!")
@@ -421,8 +724,8 @@ def test_browser():
         traceback.print_exc()
         return False
     finally:
-        print("🔄 Cleaning up browser instance")
-        helium.kill_browser()
+        # The session stays alive for the next task; atexit kills it once
+        print("🔄 Keeping browser open for reuse")
 
 def identify_the_forms():
     """Review react web pages and find the form elements on the page."""